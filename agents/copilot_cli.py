@@ -8,13 +8,15 @@ builds via libCRS -> tests via libCRS -> iterates -> writes final .diff
 to patches_dir.
 """
 
+import functools
 import json
 import logging
 import os
+import select
 import shutil
 import signal
+import string
 import subprocess
-import time
 from pathlib import Path
 
 logger = logging.getLogger("agent.copilot_cli")
@@ -32,6 +34,24 @@ except ValueError:
 if AGENT_TIMEOUT < 0:
     AGENT_TIMEOUT = 0
 
+# How long to wait after SIGTERM before escalating to SIGKILL.
+try:
+    AGENT_KILL_GRACE_MS = int(os.environ.get("AGENT_KILL_GRACE_MS", "5000"))
+except ValueError:
+    AGENT_KILL_GRACE_MS = 5000
+if AGENT_KILL_GRACE_MS < 0:
+    AGENT_KILL_GRACE_MS = 0
+
+# poll() takes a C int of milliseconds (~24.8 days).
+_MAX_POLL_TIMEOUT_MS = 2**31 - 1
+
+# AGENTS.md is written into the source tree; keep it and the temp file
+# _atomic_write() renames into place out of git's view.
+_GLOBAL_GITIGNORE_ENTRIES = ("AGENTS.md", "AGENTS.md.tmp")
+
+# Set once git's global core.excludesFile points at ~/.gitignore.
+_GITIGNORE_CONFIGURED = False
+
 _TEMPLATE_PATH = Path(__file__).with_suffix(".md")
 _SECTIONS_DIR = _TEMPLATE_PATH.with_name("sections")
 
@@ -41,6 +61,7 @@ def _load_section(section_name: str) -> str:
     return section_path.read_text()
 
 
+@functools.lru_cache(maxsize=None)
 def _load_prompt_templates() -> dict[str, str]:
     return {
         "agents_md": _TEMPLATE_PATH.read_text(),
@@ -54,6 +75,39 @@ def _load_prompt_templates() -> dict[str, str]:
     }
 
 
+@functools.lru_cache(maxsize=None)
+def _parse_template(template: str) -> tuple[tuple[str, str | None], ...]:
+    """Split a str.format template into (literal, field_name) pairs once."""
+    parts = []
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+        if format_spec or conversion:
+            raise ValueError(f"Unsupported conversion/format spec in template field {field_name!r}")
+        parts.append((literal, field_name))
+    return tuple(parts)
+
+
+def _render(template: str, **fields: object) -> str:
+    """Equivalent of template.format(**fields) using the memoized parse."""
+    return "".join(
+        literal if field_name is None else f"{literal}{fields[field_name]}"
+        for literal, field_name in _parse_template(template)
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_template_bytes(template: str) -> tuple[tuple[bytes, str | None], ...]:
+    """_parse_template() with the literal text pre-encoded to UTF-8."""
+    return tuple((literal.encode(), field_name) for literal, field_name in _parse_template(template))
+
+
+def _render_bytes(template: str, **fields: object) -> bytes:
+    """Equivalent of template.format(**fields).encode() without the full-document encode."""
+    return b"".join(
+        literal if field_name is None else literal + str(fields[field_name]).encode()
+        for literal, field_name in _parse_template_bytes(template)
+    )
+
+
 def _md_inline(value: str) -> str:
     """Return a markdown-safe inline code span."""
     ticks = 1
@@ -66,12 +120,19 @@ def _md_inline(value: str) -> str:
 def _snapshot_patch_state(patches_dir: Path) -> dict[str, tuple[int, int]]:
     """Capture patch file state by name -> (mtime_ns, size)."""
     state: dict[str, tuple[int, int]] = {}
-    for p in patches_dir.glob("*.diff"):
-        try:
-            st = p.stat()
-        except OSError:
-            continue
-        state[p.name] = (st.st_mtime_ns, st.st_size)
+    try:
+        entries = os.scandir(patches_dir)
+    except OSError:
+        return state
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith(".diff"):
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            state[entry.name] = (st.st_mtime_ns, st.st_size)
     return state
 
 
@@ -83,11 +144,134 @@ def _changed_patches(
     return sorted(name for name, state in now.items() if before.get(name) != state)
 
 
+def _wait_for_exit(proc: subprocess.Popen, timeout: float | None) -> bool:
+    """Wait for proc to exit; return False if the timeout elapsed first.
+
+    Popen.wait(timeout=...) polls waitpid(WNOHANG) in a sleep loop, so block
+    on a pidfd instead when the kernel supports it and the timeout fits in
+    poll()'s millisecond argument.
+    """
+    if timeout is None:
+        proc.wait()
+        return True
+    timeout_ms = timeout * 1000
+    if timeout_ms <= _MAX_POLL_TIMEOUT_MS:
+        try:
+            pidfd = os.pidfd_open(proc.pid)
+        except (AttributeError, OSError):
+            pidfd = None
+        if pidfd is not None:
+            try:
+                poller = select.poll()
+                poller.register(pidfd, select.POLLIN)
+                exited = bool(poller.poll(timeout_ms))
+            finally:
+                os.close(pidfd)
+            if exited:
+                proc.wait()
+            return exited
+    try:
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return False
+    return True
+
+
+def _walk_files(root: Path) -> list[Path]:
+    """Return sorted non-hidden files under root, pruning hidden directories."""
+    found: list[str] = []
+    stack = [str(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            # Missing or unreadable directories are skipped, as rglob did.
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    found.append(entry.path)
+    # Compare by path component so the order matches sorting Path objects.
+    found.sort(key=lambda p: p.split(os.sep))
+    return [Path(p) for p in found]
+
+
+def _has_content(path: Path, chunk_size: int = 64 * 1024) -> bool:
+    """Return True if the file contains any non-whitespace byte."""
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            if chunk.strip():
+                return True
+    return False
+
+
 def _list_input_files(input_dir: Path, *, non_empty_only: bool = False) -> list[Path]:
-    files = sorted(f for f in input_dir.rglob("*") if f.is_file() and not f.name.startswith("."))
+    files = _walk_files(input_dir)
     if not non_empty_only:
         return files
-    return [f for f in files if f.read_text(errors="replace").strip()]
+    return [f for f in files if _has_content(f)]
+
+
+def _atomic_write(path: Path, data: bytes, mode: int = 0o644) -> None:
+    """Write data via a temp file + rename so readers never see a partial file.
+
+    Symlinks are resolved first so the rename replaces the link target, not
+    the link itself.
+    """
+    path = path.resolve()
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+        try:
+            # A temp file left by a killed run keeps its old mode on O_TRUNC.
+            os.fchmod(fd, mode)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _ensure_global_gitignore() -> None:
+    """Globally ignore AGENTS.md and its temp file, skipping work already done."""
+    global _GITIGNORE_CONFIGURED
+    global_gitignore = Path.home() / ".gitignore"
+    existing = ""
+    if global_gitignore.exists():
+        existing = global_gitignore.read_text(errors="replace")
+    lines = [line.rstrip("\n") for line in existing.splitlines()]
+    for entry in _GLOBAL_GITIGNORE_ENTRIES:
+        if entry not in lines:
+            lines.append(entry)
+    content = "\n".join(lines).rstrip("\n") + "\n"
+    if content != existing:
+        _atomic_write(global_gitignore, content.encode())
+    if _GITIGNORE_CONFIGURED:
+        return
+    try:
+        git_cfg = subprocess.run(
+            ["git", "config", "--global", "core.excludesFile", str(global_gitignore)],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+        if git_cfg.returncode != 0:
+            logger.warning(
+                "Failed to set global git excludesFile: %s",
+                git_cfg.stderr.decode(errors="replace") if isinstance(git_cfg.stderr, bytes) else git_cfg.stderr,
+            )
+        else:
+            _GITIGNORE_CONFIGURED = True
+    except OSError as e:
+        logger.warning("Failed to run git config for excludesFile: %s", e)
 
 
 def setup(source_dir: Path, config: dict) -> None:
@@ -134,32 +318,12 @@ def setup(source_dir: Path, config: dict) -> None:
         "model": COPILOT_MODEL,
     }
     config_path = copilot_home / "config.json"
-    config_path.write_text(json.dumps(copilot_config, indent=2))
-    config_path.chmod(0o600)
+    _atomic_write(config_path, json.dumps(copilot_config, indent=2).encode(), mode=0o600)
     logger.info("Wrote config.json to %s (model=%s)", config_path, COPILOT_MODEL)
 
     logger.info("Model: %s", COPILOT_MODEL)
 
-    global_gitignore = Path.home() / ".gitignore"
-    existing = ""
-    if global_gitignore.exists():
-        existing = global_gitignore.read_text(errors="replace")
-    lines = [line.rstrip("\n") for line in existing.splitlines()]
-    if "AGENTS.md" not in lines:
-        lines.append("AGENTS.md")
-    global_gitignore.write_text("\n".join(lines).rstrip("\n") + "\n")
-    try:
-        git_cfg = subprocess.run(
-            ["git", "config", "--global", "core.excludesFile", str(global_gitignore)],
-            capture_output=True,
-        )
-        if git_cfg.returncode != 0:
-            logger.warning(
-                "Failed to set global git excludesFile: %s",
-                git_cfg.stderr.decode(errors="replace") if isinstance(git_cfg.stderr, bytes) else git_cfg.stderr,
-            )
-    except OSError as e:
-        logger.warning("Failed to run git config for excludesFile: %s", e)
+    _ensure_global_gitignore()
 
     logger.info("Agent setup complete")
 
@@ -197,44 +361,50 @@ def run(
     diffs = _list_input_files(diff_dir, non_empty_only=True)
     seeds = _list_input_files(seed_dir)
 
-    pov_sections = []
-    for pov_path in povs:
-        pov_sections.append(
-            f"- POV: {_md_inline(str(pov_path))}\n"
-            f"  Reproduce/Test: {_md_inline(f'libCRS run-pov {pov_path} <response_dir> --harness {harness} [--rebuild-id <rebuild_id>]')}"
-        )
+    # Inline code spans are shared by the AGENTS.md lists and the prompt.
+    pov_paths = [str(p) for p in povs]
+    pov_spans = [_md_inline(p) for p in pov_paths]
+    bug_candidate_spans = [_md_inline(str(p)) for p in bug_candidates]
+    diff_spans = [_md_inline(str(p)) for p in diffs]
+    seed_spans = [_md_inline(str(p)) for p in seeds]
 
     fmt_vars = dict(source_dir=source_dir, work_dir=work_dir)
-    if pov_sections:
-        pov_list = "\n".join(pov_sections)
-        pov_section = templates["pov_present"].format(
+    if povs:
+        pov_list = "\n".join(
+            f"- POV: {pov_span}\n"
+            f"  Reproduce/Test: {_md_inline(f'libCRS run-pov {pov_path} <response_dir> --harness {harness} [--rebuild-id <rebuild_id>]')}"
+            for pov_path, pov_span in zip(pov_paths, pov_spans)
+        )
+        pov_section = _render(
+            templates["pov_present"],
             pov_count=len(povs),
             pov_list=pov_list,
         )
-        workflow_section = templates["workflow_pov"].format(**fmt_vars)
+        workflow_section = _render(templates["workflow_pov"], **fmt_vars)
         pre_submit_pov = "- [ ] `retcode` = 0 for EVERY provided POV variant\n"
     else:
         pov_section = ""
-        workflow_section = templates["workflow_static"].format(**fmt_vars)
+        workflow_section = _render(templates["workflow_static"], **fmt_vars)
         pre_submit_pov = ""
 
-    bug_candidate_list = "\n".join(f"- {_md_inline(str(p))}" for p in bug_candidates)
+    bug_candidate_list = "\n".join(f"- {span}" for span in bug_candidate_spans)
     if bug_candidate_list:
-        bug_candidate_section = templates["bug_candidates_present"].format(
+        bug_candidate_section = _render(
+            templates["bug_candidates_present"],
             bug_candidate_list=bug_candidate_list
         )
     else:
         bug_candidate_section = ""
 
-    diff_list = "\n".join(f"- {_md_inline(str(p))}" for p in diffs)
+    diff_list = "\n".join(f"- {span}" for span in diff_spans)
     if diff_list:
-        diff_section = templates["diff_present"].format(diff_list=diff_list)
+        diff_section = _render(templates["diff_present"], diff_list=diff_list)
     else:
         diff_section = ""
 
-    seed_list = "\n".join(f"- {_md_inline(str(p))}" for p in seeds)
+    seed_list = "\n".join(f"- {span}" for span in seed_spans)
     if seed_list:
-        seed_section = templates["seed_present"].format(seed_list=seed_list)
+        seed_section = _render(templates["seed_present"], seed_list=seed_list)
     else:
         seed_section = ""
 
@@ -245,12 +415,14 @@ def run(
     else:
         diff_validation_hint = ""
 
-    pre_submit_section = templates["pre_submit"].format(
+    pre_submit_section = _render(
+        templates["pre_submit"],
         pov_line=pre_submit_pov,
         diff_line=diff_validation_hint,
     )
 
-    agents_md = templates["agents_md"].format(
+    agents_md = _render_bytes(
+        templates["agents_md"],
         language=language,
         sanitizer=sanitizer,
         source_dir=source_dir,
@@ -264,7 +436,7 @@ def run(
         pre_submit_section=pre_submit_section,
         diff_section=diff_section,
     )
-    (source_dir / "AGENTS.md").write_text(agents_md)
+    _atomic_write(source_dir / "AGENTS.md", agents_md)
 
     target = os.environ.get("OSS_CRS_TARGET", source_dir.name)
 
@@ -278,17 +450,13 @@ def run(
         f"- Seed files: {len(seeds)}",
     ]
     if povs:
-        pov_files = " ".join(_md_inline(str(p)) for p in povs)
-        prompt_lines.append(f"- POV files: {pov_files}")
+        prompt_lines.append(f"- POV files: {' '.join(pov_spans)}")
     if bug_candidates:
-        bug_files = " ".join(_md_inline(str(p)) for p in bug_candidates)
-        prompt_lines.append(f"- Bug-candidate report files: {bug_files}")
+        prompt_lines.append(f"- Bug-candidate report files: {' '.join(bug_candidate_spans)}")
     if diffs:
-        diff_files = " ".join(_md_inline(str(p)) for p in diffs)
-        prompt_lines.append(f"- Diff files: {diff_files}")
+        prompt_lines.append(f"- Diff files: {' '.join(diff_spans)}")
     if seeds:
-        seed_files = " ".join(_md_inline(str(p)) for p in seeds)
-        prompt_lines.append(f"- Seed files: {seed_files}")
+        prompt_lines.append(f"- Seed files: {' '.join(seed_spans)}")
     prompt_lines.extend(
         [
             "",
@@ -313,7 +481,9 @@ def run(
     existing_patches = _snapshot_patch_state(patches_dir)
 
     try:
-        with open(stdout_log, "w") as out_f, open(stderr_log, "w") as err_f:
+        # Unbuffered so nothing can sit in a Python-side buffer; the child
+        # writes straight to the inherited fds either way.
+        with open(stdout_log, "wb", buffering=0) as out_f, open(stderr_log, "wb", buffering=0) as err_f:
             proc = subprocess.Popen(
                 cmd,
                 stdout=out_f,
@@ -322,15 +492,13 @@ def run(
                 cwd=source_dir,
                 start_new_session=True,
             )
-            try:
-                proc.wait(timeout=AGENT_TIMEOUT or None)
+            if _wait_for_exit(proc, AGENT_TIMEOUT or None):
                 logger.info("Copilot CLI exit code: %d", proc.returncode)
-            except subprocess.TimeoutExpired:
+            else:
                 logger.warning("Copilot CLI timed out (%ds), killing process tree", AGENT_TIMEOUT)
                 try:
                     os.killpg(proc.pid, signal.SIGTERM)
-                    time.sleep(2)
-                    if proc.poll() is None:
+                    if not _wait_for_exit(proc, AGENT_KILL_GRACE_MS / 1000):
                         os.killpg(proc.pid, signal.SIGKILL)
                 except ProcessLookupError:
                     pass
@@ -348,7 +516,8 @@ def run(
 
     subprocess.run(
         ["chmod", "-R", "og+rX", str(Path.home() / ".copilot")],
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
 
     if proc.returncode != 0:
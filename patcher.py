@@ -9,6 +9,7 @@ submission (writing .diff to /patches/).
 To add a new agent, create a module in agents/ implementing setup() and run().
 """
 
+import functools
 import hashlib
 import importlib
 import inspect
@@ -19,6 +20,7 @@ import subprocess
 import sys
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from libCRS.base import DataType
@@ -47,6 +49,7 @@ POV_DIR = WORK_DIR / "povs"
 DIFF_DIR = WORK_DIR / "diffs"
 BUG_CANDIDATE_DIR = WORK_DIR / "bug-candidates"
 SEED_DIR = WORK_DIR / "seeds"
+AGENT_WORK_DIR = WORK_DIR / "agent"
 PATCH_POLL_INTERVAL_SECS = 0.5
 PATCH_STABLE_POLLS = 3
 PATCH_FALLBACK_WAIT_SECS = 2.0
@@ -54,23 +57,48 @@ PATCH_FALLBACK_WAIT_SECS = 2.0
 crs = None
 
 
+def _stale_git_locks(git_dir: Path) -> list[Path]:
+    """Return *.lock files in git_dir and under git_dir/refs.
+
+    These are the locations git takes locks in for reset/clean/commit;
+    objects/ is skipped since walking it is the expensive part of .git.
+    """
+    locks: list[Path] = []
+    stack = [str(git_dir)]
+    while stack:
+        current = stack.pop()
+        try:
+            entries = os.scandir(current)
+        except OSError:
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name.endswith(".lock") and entry.is_file(follow_symlinks=False):
+                    locks.append(Path(entry.path))
+                elif entry.is_dir(follow_symlinks=False) and (
+                    entry.name == "refs" or current != str(git_dir)
+                ):
+                    stack.append(entry.path)
+    return locks
+
+
 def _reset_source(source_dir: Path) -> None:
     """Reset source directory to HEAD, cleaning up stale lock files."""
-    for lock_file in source_dir.glob(".git/**/*.lock"):
+    for lock_file in _stale_git_locks(source_dir / ".git"):
         logger.warning("Removing stale lock file: %s", lock_file)
         lock_file.unlink()
 
     reset_proc = subprocess.run(
-        ["git", "reset", "--hard", "HEAD"],
-        cwd=source_dir, capture_output=True, timeout=60,
-    )
-    clean_proc = subprocess.run(
-        ["git", "clean", "-fd"],
-        cwd=source_dir, capture_output=True, timeout=60,
+        ["git", "reset", "--hard", "-q", "HEAD"],
+        cwd=source_dir, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=60,
     )
     if reset_proc.returncode != 0:
         stderr = reset_proc.stderr.decode(errors="replace") if isinstance(reset_proc.stderr, bytes) else str(reset_proc.stderr)
         raise RuntimeError(f"git reset failed: {stderr.strip()}")
+    clean_proc = subprocess.run(
+        ["git", "clean", "-fdq"],
+        cwd=source_dir, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=60,
+    )
     if clean_proc.returncode != 0:
         stderr = clean_proc.stderr.decode(errors="replace") if isinstance(clean_proc.stderr, bytes) else str(clean_proc.stderr)
         raise RuntimeError(f"git clean failed: {stderr.strip()}")
@@ -79,12 +107,19 @@ def _reset_source(source_dir: Path) -> None:
 def _snapshot_patch_state(patches_dir: Path) -> dict[str, tuple[int, int]]:
     """Capture patch file state by name -> (mtime_ns, size)."""
     state: dict[str, tuple[int, int]] = {}
-    for p in patches_dir.glob("*.diff"):
-        try:
-            st = p.stat()
-        except OSError:
-            continue
-        state[p.name] = (st.st_mtime_ns, st.st_size)
+    try:
+        entries = os.scandir(patches_dir)
+    except OSError:
+        return state
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith(".diff"):
+                continue
+            try:
+                st = entry.stat()
+            except OSError:
+                continue
+            state[entry.name] = (st.st_mtime_ns, st.st_size)
     return state
 
 
@@ -193,13 +228,13 @@ def _watch_for_first_patch(
     while not stop_event.is_set():
         candidate_path = _observe_first_patch(existing_patches, first_patch_name_ref)
         if candidate_path is None:
-            time.sleep(PATCH_POLL_INTERVAL_SECS)
+            stop_event.wait(PATCH_POLL_INTERVAL_SECS)
             continue
         signature = _read_patch_signature(candidate_path)
         if signature is None:
             last_signature = None
             stable_polls = 0
-            time.sleep(PATCH_POLL_INTERVAL_SECS)
+            stop_event.wait(PATCH_POLL_INTERVAL_SECS)
             continue
         if signature == last_signature:
             stable_polls += 1
@@ -213,7 +248,7 @@ def _watch_for_first_patch(
                 submission_lock,
                 exit_after_submit=True,
             )
-        time.sleep(PATCH_POLL_INTERVAL_SECS)
+        stop_event.wait(PATCH_POLL_INTERVAL_SECS)
 
 
 def _wait_for_stable_first_patch(
@@ -247,16 +282,55 @@ def _wait_for_stable_first_patch(
     return None
 
 
-def setup_source() -> Path | None:
-    """Download build-output /src and prepare it as the working directory."""
+def _walk_files(root: Path) -> list[Path]:
+    """Return sorted non-hidden files under root, pruning hidden directories."""
+    found: list[str] = []
+    stack = [str(root)]
+    while stack:
+        try:
+            entries = os.scandir(stack.pop())
+        except OSError:
+            # Missing or unreadable directories are skipped, as rglob did.
+            continue
+        with entries:
+            for entry in entries:
+                if entry.name.startswith("."):
+                    continue
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    found.append(entry.path)
+    # Compare by path component so the order matches sorting Path objects.
+    found.sort(key=lambda p: p.split(os.sep))
+    return [Path(p) for p in found]
+
+
+def _has_content(path: Path, chunk_size: int = 64 * 1024) -> bool:
+    """Return True if the file contains any non-whitespace byte."""
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            if chunk.strip():
+                return True
+    return False
+
+
+def setup_source(crs_utils=None) -> Path | None:
+    """Download build-output /src and prepare it as the working directory.
+
+    crs_utils defaults to the module-level crs instance.
+    """
+    if crs_utils is None:
+        crs_utils = crs
     safe_dir_proc = subprocess.run(
         ["git", "config", "--system", "--add", "safe.directory", "*"],
-        capture_output=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
     )
     if safe_dir_proc.returncode != 0:
         fallback_proc = subprocess.run(
             ["git", "config", "--global", "--add", "safe.directory", "*"],
-            capture_output=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
         )
         if fallback_proc.returncode != 0:
             logger.warning(
@@ -264,7 +338,7 @@ def setup_source() -> Path | None:
             )
 
     try:
-        crs.download_build_output("src", SRC_DIR)
+        crs_utils.download_build_output("src", SRC_DIR)
     except Exception as e:
         logger.error("Failed to download /src build output via libCRS: %s", e)
         return None
@@ -275,8 +349,14 @@ def setup_source() -> Path | None:
         return worktree_dir
 
     logger.info("No .git found in %s, initializing git repo", worktree_dir)
-    subprocess.run(["git", "init"], cwd=worktree_dir, capture_output=True, timeout=60)
-    subprocess.run(["git", "add", "-A"], cwd=worktree_dir, capture_output=True, timeout=60)
+    subprocess.run(
+        ["git", "init"],
+        cwd=worktree_dir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=60,
+    )
+    subprocess.run(
+        ["git", "add", "-A"],
+        cwd=worktree_dir, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=60,
+    )
     commit_proc = subprocess.run(
         [
             "git",
@@ -288,7 +368,7 @@ def setup_source() -> Path | None:
             "-m",
             "initial source",
         ],
-        cwd=worktree_dir, capture_output=True, timeout=60,
+        cwd=worktree_dir, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, timeout=60,
     )
     if commit_proc.returncode != 0:
         stderr = (
@@ -302,7 +382,16 @@ def setup_source() -> Path | None:
     return worktree_dir
 
 
+def _fetch_input(data_type, dst_dir: Path):
+    """Fetch one input type using a libCRS utils instance private to this call.
+
+    libCRS does not document its utils object as thread-safe, so concurrent
+    startup workers never share the module-level crs instance.
+    """
+    return init_crs_utils().fetch(data_type, dst_dir)
 
+
+@functools.lru_cache(maxsize=4)
 def load_agent(agent_name: str):
     """Dynamically load an agent module from the agents package."""
     module_name = f"agents.{agent_name}"
@@ -328,8 +417,7 @@ def process_inputs(
         logger.error("Failed to reset source before agent run: %s", e)
         return False
 
-    agent_work_dir = WORK_DIR / "agent"
-    agent_work_dir.mkdir(parents=True, exist_ok=True)
+    AGENT_WORK_DIR.mkdir(parents=True, exist_ok=True)
 
     existing_patches = _snapshot_patch_state(PATCHES_DIR)
     first_patch_name_ref: dict[str, str | None] = {"name": None}
@@ -366,7 +454,7 @@ def process_inputs(
         "seed_dir": SEED_DIR,
         "harness": HARNESS,
         "patches_dir": PATCHES_DIR,
-        "work_dir": agent_work_dir,
+        "work_dir": AGENT_WORK_DIR,
     }
     optional_kwargs = {
         "language": LANGUAGE,
@@ -427,22 +515,35 @@ def main():
 
     PATCHES_DIR.mkdir(parents=True, exist_ok=True)
 
+    # Input fetches, the /src download and the agent import are independent,
+    # so start them together and collect each result where it is first needed.
+    # Each libCRS-using worker gets its own init_crs_utils() instance; the
+    # main thread keeps crs for log-dir registration meanwhile.
+    startup_pool = ThreadPoolExecutor(max_workers=6, thread_name_prefix="startup")
+    pov_fetch = startup_pool.submit(_fetch_input, DataType.POV, POV_DIR)
+    diff_fetch = startup_pool.submit(_fetch_input, DataType.DIFF, DIFF_DIR)
+    bug_fetch = startup_pool.submit(_fetch_input, DataType.BUG_CANDIDATE, BUG_CANDIDATE_DIR)
+    seed_fetch = startup_pool.submit(_fetch_input, DataType.SEED, SEED_DIR)
+    source_setup = startup_pool.submit(lambda: setup_source(init_crs_utils()))
+    agent_load = startup_pool.submit(load_agent, CRS_AGENT)
+    startup_pool.shutdown(wait=False)
+
     try:
-        pov_files_fetched = crs.fetch(DataType.POV, POV_DIR)
+        pov_files_fetched = pov_fetch.result()
         if pov_files_fetched:
             logger.info("Fetched %d POV file(s) into %s", len(pov_files_fetched), POV_DIR)
     except Exception as e:
         logger.info("No POV input fetched: %s", e)
 
     try:
-        diff_files_fetched = crs.fetch(DataType.DIFF, DIFF_DIR)
+        diff_files_fetched = diff_fetch.result()
         if diff_files_fetched:
             logger.info("Fetched %d diff file(s) into %s", len(diff_files_fetched), DIFF_DIR)
     except Exception as e:
         logger.warning("Diff fetch failed: %s — delta mode diffs unavailable", e)
 
     try:
-        bug_files_fetched = crs.fetch(DataType.BUG_CANDIDATE, BUG_CANDIDATE_DIR)
+        bug_files_fetched = bug_fetch.result()
         if bug_files_fetched:
             logger.info(
                 "Fetched %d bug-candidate file(s) into %s",
@@ -453,7 +554,7 @@ def main():
         logger.warning("Bug-candidate fetch failed: %s — static findings unavailable", e)
 
     try:
-        seed_files_fetched = crs.fetch(DataType.SEED, SEED_DIR)
+        seed_files_fetched = seed_fetch.result()
         if seed_files_fetched:
             logger.info("Fetched %d seed file(s) into %s", len(seed_files_fetched), SEED_DIR)
     except Exception as e:
@@ -491,34 +592,30 @@ def main():
 
     # Register agent work directory as a log dir so stdout/stderr and
     # libCRS response directories are persisted for post-run analysis.
-    agent_work_dir = WORK_DIR / "agent"
     try:
-        crs.register_log_dir(agent_work_dir)
-        logger.info("Agent work dir registered as log dir at %s", agent_work_dir)
+        crs.register_log_dir(AGENT_WORK_DIR)
+        logger.info("Agent work dir registered as log dir at %s", AGENT_WORK_DIR)
     except Exception as e:
         logger.warning("Failed to register agent work log dir: %s", e)
 
-    worktree_dir = setup_source()
+    worktree_dir = source_setup.result()
     if worktree_dir is None:
         logger.error("Failed to set up source directory")
         sys.exit(1)
 
     logger.info("Worktree directory: %s", worktree_dir)
 
-    agent = load_agent(CRS_AGENT)
+    agent = agent_load.result()
     agent.setup(worktree_dir, {
         "copilot_github_token": COPILOT_GITHUB_TOKEN,
         "copilot_subscription_token": COPILOT_SUBSCRIPTION_TOKEN,
         "copilot_home": str(copilot_home),
     })
 
-    pov_files = sorted(f for f in POV_DIR.rglob("*") if f.is_file() and not f.name.startswith("."))
-    bug_candidate_files = sorted(
-        f for f in BUG_CANDIDATE_DIR.rglob("*") if f.is_file() and not f.name.startswith(".")
-    )
-    diff_files = sorted(f for f in DIFF_DIR.rglob("*") if f.is_file() and not f.name.startswith("."))
-    diff_files = [f for f in diff_files if f.read_text(errors="replace").strip()]
-    seed_files = sorted(f for f in SEED_DIR.rglob("*") if f.is_file() and not f.name.startswith("."))
+    pov_files = _walk_files(POV_DIR)
+    bug_candidate_files = _walk_files(BUG_CANDIDATE_DIR)
+    diff_files = [f for f in _walk_files(DIFF_DIR) if _has_content(f)]
+    seed_files = _walk_files(SEED_DIR)
 
     if not pov_files and not bug_candidate_files and not diff_files and not seed_files:
         logger.warning(
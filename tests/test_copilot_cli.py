@@ -83,3 +83,101 @@ def test_run_invokes_copilot_with_correct_flags(monkeypatch, tmp_path: Path) ->
     assert "-p" in cmd
     assert "--model" in cmd
     assert "--yolo" in cmd
+
+
+def test_render_matches_str_format_on_shipped_templates() -> None:
+    templates = copilot_cli._load_prompt_templates()
+    fields = {
+        name: f"<{name}>"
+        for template in templates.values()
+        for _, name in copilot_cli._parse_template(template)
+        if name is not None
+    }
+    for template in templates.values():
+        assert copilot_cli._render(template, **fields) == template.format(**fields)
+        assert copilot_cli._render_bytes(template, **fields) == template.format(**fields).encode()
+
+
+def test_wait_for_exit_times_out_then_reaps() -> None:
+    proc = copilot_cli.subprocess.Popen(["sleep", "30"])
+    try:
+        assert copilot_cli._wait_for_exit(proc, 0.1) is False
+        assert proc.poll() is None
+    finally:
+        proc.kill()
+    assert copilot_cli._wait_for_exit(proc, 5) is True
+    assert proc.returncode is not None
+
+
+def test_list_input_files_skips_hidden_entries(tmp_path: Path) -> None:
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "b.bin").write_bytes(b"b")
+    (tmp_path / "a.bin").write_bytes(b"a")
+    (tmp_path / ".hidden.bin").write_bytes(b"h")
+    (tmp_path / ".git").mkdir()
+    (tmp_path / ".git" / "HEAD").write_bytes(b"ref")
+
+    assert copilot_cli._list_input_files(tmp_path) == [
+        tmp_path / "a.bin",
+        tmp_path / "nested" / "b.bin",
+    ]
+    assert copilot_cli._list_input_files(tmp_path / "missing") == []
+
+
+def test_wait_for_exit_accepts_timeouts_beyond_poll_range() -> None:
+    proc = copilot_cli.subprocess.Popen(["true"])
+    assert copilot_cli._wait_for_exit(proc, 2_592_000) is True
+    assert proc.returncode == 0
+
+
+def test_list_input_files_orders_like_path_sort(tmp_path: Path) -> None:
+    (tmp_path / "a").mkdir()
+    (tmp_path / "a" / "b.bin").write_bytes(b"b")
+    (tmp_path / "a-c.bin").write_bytes(b"c")
+
+    files = copilot_cli._list_input_files(tmp_path)
+
+    assert files == sorted(files)
+    assert files == [tmp_path / "a" / "b.bin", tmp_path / "a-c.bin"]
+
+
+def test_list_input_files_skips_unreadable_dirs(monkeypatch, tmp_path: Path) -> None:
+    (tmp_path / "locked").mkdir()
+    (tmp_path / "locked" / "x.bin").write_bytes(b"x")
+    (tmp_path / "a.bin").write_bytes(b"a")
+    real_scandir = copilot_cli.os.scandir
+
+    def fake_scandir(path):
+        if str(path) == str(tmp_path / "locked"):
+            raise PermissionError(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(copilot_cli.os, "scandir", fake_scandir)
+
+    assert copilot_cli._list_input_files(tmp_path) == [tmp_path / "a.bin"]
+
+
+def test_atomic_write_sets_mode_over_stale_temp_file(tmp_path: Path) -> None:
+    target = tmp_path / "config.json"
+    stale_tmp = tmp_path / "config.json.tmp"
+    stale_tmp.write_text("partial")
+    stale_tmp.chmod(0o644)
+
+    copilot_cli._atomic_write(target, b'{"model": "x"}', mode=0o600)
+
+    assert target.read_bytes() == b'{"model": "x"}'
+    assert target.stat().st_mode & 0o777 == 0o600
+    assert not stale_tmp.exists()
+
+
+def test_atomic_write_keeps_symlink(tmp_path: Path) -> None:
+    real = tmp_path / "dotfiles" / "gitignore"
+    real.parent.mkdir()
+    real.write_text("old\n")
+    link = tmp_path / ".gitignore"
+    link.symlink_to(real)
+
+    copilot_cli._atomic_write(link, b"new\n")
+
+    assert link.is_symlink()
+    assert real.read_bytes() == b"new\n"
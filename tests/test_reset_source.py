@@ -0,0 +1,59 @@
+import subprocess
+from pathlib import Path
+
+import pytest
+
+import patcher
+
+
+def test_stale_git_locks_skips_objects_dir(tmp_path: Path) -> None:
+    git_dir = tmp_path / ".git"
+    (git_dir / "refs" / "heads" / "feature").mkdir(parents=True)
+    (git_dir / "objects" / "ab").mkdir(parents=True)
+    (git_dir / "index.lock").touch()
+    (git_dir / "packed-refs.lock").touch()
+    (git_dir / "refs" / "heads" / "feature" / "topic.lock").touch()
+    (git_dir / "objects" / "ab" / "tmp.lock").touch()
+
+    locks = sorted(patcher._stale_git_locks(git_dir))
+
+    assert locks == [
+        git_dir / "index.lock",
+        git_dir / "packed-refs.lock",
+        git_dir / "refs" / "heads" / "feature" / "topic.lock",
+    ]
+
+
+def test_stale_git_locks_without_git_dir(tmp_path: Path) -> None:
+    assert patcher._stale_git_locks(tmp_path / ".git") == []
+
+
+def _git(cwd: Path, *args: str) -> None:
+    subprocess.run(
+        ["git", "-c", "user.name=test", "-c", "user.email=test@local", *args],
+        cwd=cwd, capture_output=True, check=True,
+    )
+
+
+def test_reset_source_restores_head_and_removes_untracked(tmp_path: Path) -> None:
+    (tmp_path / "main.c").write_text("original\n")
+    _git(tmp_path, "init", "-q")
+    _git(tmp_path, "add", "-A")
+    _git(tmp_path, "commit", "-q", "-m", "init")
+    (tmp_path / "main.c").write_text("edited\n")
+    (tmp_path / "scratch").mkdir()
+    (tmp_path / "scratch" / "notes.txt").write_text("x")
+    (tmp_path / ".git" / "index.lock").touch()
+
+    patcher._reset_source(tmp_path)
+
+    assert (tmp_path / "main.c").read_text() == "original\n"
+    assert not (tmp_path / "scratch").exists()
+    assert not (tmp_path / ".git" / "index.lock").exists()
+
+
+def test_reset_source_reports_failing_git_step(monkeypatch, tmp_path: Path) -> None:
+    # Stop git from discovering an enclosing repo (e.g. --basetemp inside a checkout).
+    monkeypatch.setenv("GIT_CEILING_DIRECTORIES", str(tmp_path.parent))
+    with pytest.raises(RuntimeError, match="^git reset failed"):
+        patcher._reset_source(tmp_path)
@@ -1,3 +1,4 @@
+import subprocess
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -20,7 +21,7 @@ def test_setup_source_returns_src_dir(
 
     calls: list[tuple[list[str], Path | None]] = []
 
-    def fake_run(cmd, cwd=None, capture_output=None, timeout=None):
+    def fake_run(cmd, cwd=None, **kwargs):
         calls.append((list(cmd), cwd))
         return SimpleNamespace(returncode=0, stderr=b"")
 
@@ -48,7 +49,7 @@ def test_setup_source_initializes_git_when_no_dotgit(
 
     calls: list[tuple[list[str], Path | None]] = []
 
-    def fake_run(cmd, cwd=None, capture_output=None, timeout=None):
+    def fake_run(cmd, cwd=None, **kwargs):
         calls.append((list(cmd), cwd))
         return SimpleNamespace(returncode=0, stderr=b"")
 
@@ -58,3 +59,39 @@ def test_setup_source_initializes_git_when_no_dotgit(
 
     assert resolved == src_dir.resolve()
     assert (["git", "init"], src_dir.resolve()) in calls
+
+
+def test_setup_source_commits_downloaded_tree(monkeypatch, tmp_path: Path) -> None:
+    src_dir = tmp_path / "src"
+    src_dir.mkdir()
+    (src_dir / "main.c").write_text("int main(void) { return 0; }\n")
+
+    monkeypatch.setattr(patcher, "SRC_DIR", src_dir)
+    monkeypatch.setattr(
+        patcher,
+        "crs",
+        SimpleNamespace(download_build_output=lambda name, dst: None),
+    )
+    real_run = subprocess.run
+
+    def run_without_config(cmd, *args, **kwargs):
+        # Keep the safe.directory calls away from the host's git config.
+        if list(cmd[:2]) == ["git", "config"]:
+            return SimpleNamespace(returncode=0, stderr=b"")
+        return real_run(cmd, *args, **kwargs)
+
+    monkeypatch.setattr(patcher.subprocess, "run", run_without_config)
+
+    resolved = patcher.setup_source()
+
+    assert resolved == src_dir.resolve()
+    status = subprocess.run(
+        ["git", "status", "--porcelain"],
+        cwd=src_dir, capture_output=True, text=True, check=True,
+    )
+    assert status.stdout == ""
+    tracked = subprocess.run(
+        ["git", "ls-files"],
+        cwd=src_dir, capture_output=True, text=True, check=True,
+    )
+    assert tracked.stdout.split() == ["main.c"]